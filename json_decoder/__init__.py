@@ -1,5 +1,6 @@
 # json_decoder/__init__.py
 
 from .decoder import decode, JSONDecoder
+from .lazy import decode_lazy, LazyArray, LazyObject
 
-__all__ = ["decode", "JSONDecoder"]
+__all__ = ["decode", "JSONDecoder", "decode_lazy", "LazyArray", "LazyObject"]
@@ -1,9 +1,62 @@
-from typing import Any, List, Dict
-
-
-# Run to decode any raw string
-def decode(content: str) -> Any | None:
-    decoder = JSONDecoder(content)
+import re
+import sys
+from typing import Any, List, Dict, Final
+
+# Characters that end a clean run inside a string: the closing quote, the start
+# of an escape, or a control character (which must be escaped in JSON)
+_SPECIAL_RE: Final = re.compile(r'["\\\x00-\x1f]')
+
+# The four hex digits of a \\u escape
+_HEX4_RE: Final = re.compile(r"[0-9a-fA-F]{4}")
+
+# A JSON number: optional minus, no leading zeros, optional fraction (group 1)
+# and optional exponent (group 2)
+_NUMBER_RE: Final = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+
+# A number with a leading zero, like "01" or "-007"
+_LEADING_ZERO_RE: Final = re.compile(r"-?0[0-9]")
+
+# Whitespace between tokens
+_WS_RE: Final = re.compile(r"[ \t\n\r]+")
+
+# Characters a number can start with. JSON tokens outside strings are ASCII,
+# so a set membership test replaces the Unicode-aware str.isdigit()
+_NUMBER_START: Final = frozenset("-0123456789")
+
+# Characters that may directly follow a number or a literal
+_NUMBER_END: Final = frozenset(" \t\n\r,}]")
+
+# int() only checks sys.get_int_max_str_digits() for strings longer than this,
+# and the limit can't be set below it (Pythons without the limit never raise)
+_INT_CHECK_DIGITS: Final[int] = getattr(sys.int_info, "str_digits_check_threshold", 640)
+
+# Valid escape characters that can be exist in a string in a JSON object
+_ESCAPE_CHARACTERS: Final[Dict[str, str]] = {
+    '"': '"',
+    "\\": "\\",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "b": "\b",
+    "f": "\f",
+    "/": "/",
+}
+
+# The same mapping as a table indexed by code point, "" for invalid escapes.
+# Indexing a list is cheaper than a dict lookup that may raise KeyError.
+_ESCAPE_TABLE: Final[List[str]] = [
+    _ESCAPE_CHARACTERS.get(chr(c), "") for c in range(128)
+]
+
+# Longest string value that is interned when value_intern is on
+_INTERN_MAX_LEN: Final = 16
+
+
+# Run to decode any raw string (or UTF-8 encoded bytes)
+def decode(
+    content: str | bytes | bytearray | memoryview, value_intern: bool = False
+) -> Any | None:
+    decoder = JSONDecoder(content, value_intern)
     return decoder.decode()
 
 
@@ -12,11 +65,40 @@ class JSONDecodeError(Exception):
     """Raised when JSON parsing fails due to invalid JSON"""
 
 
+# Turn the input into a str. Bytes are decoded from UTF-8 once, up front, so
+# the parser always indexes a str: indexing it at the ASCII punctuation between
+# tokens returns CPython's cached one-character strings and allocates nothing,
+# while string values are sliced out directly without decoding each one.
+def _as_text(content: str | bytes | bytearray | memoryview) -> str:
+    if isinstance(content, str):
+        return content
+    # "utf-8-sig" is UTF-8 that also drops a leading byte order mark
+    try:
+        return str(content, "utf-8-sig")
+    except UnicodeDecodeError:
+        raise JSONDecodeError("Input is not valid UTF-8")
+
+
 class JSONDecoder:
-    def __init__(self, text: str) -> None:
-        self.idx: int = -1  # current index
-        self.content: str = text  # raw content
-        self.n: int = len(text)  # length of text
+    content: str  # raw content
+    n: int  # length of text
+
+    def __init__(
+        self, text: str | bytes | bytearray | memoryview, value_intern: bool = False
+    ) -> None:
+        # Intern short string values, so enum-like values that repeat all over
+        # the document ("User", "open", ...) are stored once
+        self.value_intern: bool = value_intern
+        self.reset(text)
+
+    # Point the decoder at a new input, so one instance can decode many
+    # documents. All parse state lives in locals of decode(), so nothing else
+    # needs clearing. Returns the decoder for decoder.reset(text).decode().
+    def reset(self, text: str | bytes | bytearray | memoryview) -> "JSONDecoder":
+        text = _as_text(text)
+        self.content = text
+        self.n = len(text)
+        return self
 
     def decode(self) -> Any | None:
         """
@@ -24,250 +106,308 @@ class JSONDecoder:
         Returns JSONDecodeError if invalid JSON syntax.
         """
 
-        self._skip_whitespace()
-        result = self._parse_one()
-        self._skip_whitespace()
-
-        char = self._peek()
-        if char is not None:
+        s = self.content
+        i = 0
+        m = _WS_RE.match(s, i)
+        if m:
+            i = m.end()
+        result, i = self._parse(i)
+        m = _WS_RE.match(s, i)
+        if m:
+            i = m.end()
+
+        if i < self.n:
             raise JSONDecodeError("Extra characters after JSON")
 
         return result
 
-    # Parse one element
-    def _parse_one(self) -> Any:
-        first = self._peek()
-
-        if first is None:
-            raise JSONDecodeError("No input")
-
-        # Important gotcha - JSON doesn't have to start with an object!
-        if first == "{":
-            return self._parse_object()
-        elif first == "[":
-            return self._parse_array()
-        elif first == '"':
-            return self._parse_string()
-        elif first in ("t", "f", "n"):
-            return self._parse_literal()
-        elif first == "-" or first.isdigit():
-            return self._parse_number()
-        else:
-            raise JSONDecodeError("Invalid JSON")
-
-    # See next character (without incrementing index)
-    def _peek(self) -> str | None:
-        return self.content[self.idx + 1] if (self.idx + 1) < self.n else None
-
-    # Get next character, increment index
-    def _next(self) -> str | None:
-        char = self._peek()
-        if char is not None:
-            self.idx += 1
-        return char
+    # Every parser below takes the index of the first character it should look
+    # at and returns the parsed value together with the index right after it.
+    # The content and its length are read into locals once so the loops index
+    # the string directly instead of going through a method call per character.
+    # For the same reason the loops bind the regex methods, the other parsers
+    # and list.append to locals up front rather than looking them up each turn.
+
+    # Parse one element, objects and arrays included. Instead of recursing into
+    # every nested container, the containers still open are kept on an explicit
+    # stack, so one loop in one Python frame handles any depth of nesting (and
+    # deep input can no longer hit the recursion limit).
+    def _parse(self, i: int) -> tuple[Any, int]:
+        s = self.content
+        n = self.n
+        ws_match = _WS_RE.match
+        parse_key = self._parse_key
+        parse_string = self._parse_string
+        parse_number = self._parse_number
+        parse_literal = self._parse_literal
+        value_intern = self.value_intern
+        # Keys seen so far in this parse, so that a key repeated across many
+        # objects (a list of records, say) is kept as one shared str, like
+        # CPython's json scanner does
+        memo: Dict[str, str] = {}
+
+        stack: List[Dict[str, Any] | List[Any]] = []  # open containers, innermost last
+        keys: List[str] = []  # key waiting for its value, one per open object
+        value: Any = None
 
-    # Skip all whitespace characters starting at current index
-    def _skip_whitespace(self) -> None:
         while True:
-            char = self._peek()
-            if char is not None and char in (" ", "\t", "\n", "\r"):
-                char = self._next()
-            else:
-                break
+            # Parse the value starting at i, which is never whitespace
+            char = s[i] if i < n else None
 
-    # Parse a JSON object
-    def _parse_object(self) -> dict[str, Any]:
-        obj: dict[str, Any] = {}
-        self._next()  # consume "{"
-
-        while True:
-            self._skip_whitespace()
-            char = self._peek()  # must be either end or key
             if char is None:
-                raise JSONDecodeError("Object ends without }")
-            elif char == "}":
-                self._next()
-                break
-            elif char != '"':
-                raise JSONDecodeError("Keys must be strings")
-
-            key = self._parse_string()
-            self._skip_whitespace()
-
-            # Got the key, next one must be ":"
-            char = self._next()
-            if char is None or char != ":":
-                raise JSONDecodeError('Key not followed by ":"')
-
-            self._skip_whitespace()
-            value = self._parse_one()
-            obj[key] = value
-            self._skip_whitespace()
-
-            char = self._peek()
-            if char == ",":
-                self._next()  # consume this comma
-                self._skip_whitespace()  # consume possible whitespace
-                char = self._peek()
-                if char == ",":
-                    raise JSONDecodeError("Can't have two commas back to back")
-                elif char == "}":
-                    raise JSONDecodeError("Can't end with a trailing comma")
-            elif (
-                char != "}"
-            ):  # if not comma, must be closing bracket, another key cant come without ,
-                raise JSONDecodeError("Keys must be separated by , ")
-
-        return obj
-
-    # Valid escape characters that can be exist in a string in a JSON object
-    _ESCAPE_CHARACTERS: Dict[str, str] = {
-        '"': '"',
-        "\\": "\\",
-        "n": "\n",
-        "r": "\r",
-        "t": "\t",
-        "b": "\b",
-        "f": "\f",
-        "/": "/",
-    }
+                raise JSONDecodeError("No input")
+            # Important gotcha - JSON doesn't have to start with an object!
+            elif char == "{":
+                i += 1  # consume "{"
+                m = ws_match(s, i)
+                if m:
+                    i = m.end()
+                if i < n and s[i] == "}":
+                    i += 1
+                    value = {}
+                else:
+                    key, i = parse_key(i, memo)
+                    stack.append({})
+                    keys.append(key)
+                    continue  # go parse the first value
+            elif char == "[":
+                i += 1  # consume '['
+                m = ws_match(s, i)
+                if m:
+                    i = m.end()
+                char = s[i] if i < n else None
+                if char is None:
+                    raise JSONDecodeError("Array ends without ]")
+                elif char == "]":
+                    i += 1
+                    value = []
+                else:
+                    stack.append([])
+                    continue  # go parse the first element
+            elif char == '"':
+                value, i = parse_string(i)
+                if value_intern and len(value) <= _INTERN_MAX_LEN:
+                    value = sys.intern(value)
+            elif char in ("t", "f", "n"):
+                value, i = parse_literal(i)
+            elif char in _NUMBER_START:
+                value, i = parse_number(i)
+            else:
+                raise JSONDecodeError("Invalid JSON")
+
+            # The value is complete: store it in the innermost open container
+            # and look at what follows. Closing that container completes another
+            # value one level up, so keep going until something new must be parsed.
+            while stack:
+                container = stack[-1]
+                m = ws_match(s, i)
+                if m:
+                    i = m.end()
+                char = s[i] if i < n else None
+
+                if isinstance(container, list):
+                    container.append(value)
+                    if char == ",":
+                        i += 1  # consume this comma
+                        m = ws_match(s, i)  # consume possible whitespace after comma
+                        if m:
+                            i = m.end()
+                        char = s[i] if i < n else None
+                        if char == ",":
+                            raise JSONDecodeError("Can't have two commas back to back")
+                        elif char == "]":
+                            raise JSONDecodeError("Can't end with a trailing comma")
+                        elif char is None:
+                            raise JSONDecodeError("Array ends without ]")
+                        break
+                    elif char == "]":
+                        i += 1  # consume ']'
+                        value = stack.pop()
+                    else:  # if not comma, must be closing bracket, another element cant come
+                        raise JSONDecodeError("Array elements must be separated with ,")
+                else:
+                    container[keys[-1]] = value
+                    if char == ",":
+                        i += 1  # consume this comma
+                        m = ws_match(s, i)  # consume possible whitespace
+                        if m:
+                            i = m.end()
+                        if i < n and s[i] == ",":
+                            raise JSONDecodeError("Can't have two commas back to back")
+                        elif i < n and s[i] == "}":
+                            raise JSONDecodeError("Can't end with a trailing comma")
+                        keys[-1], i = parse_key(i, memo)
+                        break
+                    elif char == "}":
+                        i += 1  # consume "}"
+                        keys.pop()
+                        value = stack.pop()
+                    else:  # if not comma, must be closing bracket, another key cant come without ,
+                        raise JSONDecodeError("Keys must be separated by , ")
+            else:
+                return value, i
+
+    # Parse an object key and the ":" after it. Returns the key and the index of
+    # the value that belongs to it.
+    def _parse_key(self, i: int, memo: Dict[str, str]) -> tuple[str, int]:
+        s = self.content
+        n = self.n
+        char = s[i] if i < n else None  # must be a key, "}" is handled by the caller
+        if char is None:
+            raise JSONDecodeError("Object ends without }")
+        elif char != '"':
+            raise JSONDecodeError("Keys must be strings")
+
+        key, i = self._parse_string(i)
+        key = memo.setdefault(key, key)
+        m = _WS_RE.match(s, i)
+        if m:
+            i = m.end()
+
+        # Got the key, next one must be ":"
+        char = s[i] if i < n else None
+        if char is None or char != ":":
+            raise JSONDecodeError('Key not followed by ":"')
+        i += 1
+
+        m = _WS_RE.match(s, i)
+        if m:
+            i = m.end()
+        return key, i
 
     # Parse a string
-    def _parse_string(self) -> str:
-        s = ""
-        self._next()  # consume "
-        char = self._next()
-
+    def _parse_string(self, i: int) -> tuple[str, int]:
+        s = self.content
+        n = self.n
+        search = _SPECIAL_RE.search
+        i += 1  # consume "
+
+        # Fastest path: plain ASCII with no escapes. str.find looks for the
+        # closing quote and for a backslash before it, and isprintable() (on
+        # ASCII) rules out control characters, all in C and without starting
+        # the regex engine. Escaped strings are ruled out before the slice, so
+        # they don't pay for copying and scanning it.
+        end = s.find('"', i)
+        if end != -1 and s.find("\\", i, end) == -1:
+            value = s[i:end]
+            if value.isascii() and value.isprintable():
+                return value, end + 1
+
+        # Fast path: no escapes, so the value is just a slice of the content
+        m = search(s, i)
+        if m is None:
+            raise JSONDecodeError("Unterminated string")
+        if m.group() == '"':
+            return s[i : m.start()], m.end()
+
+        escape_table = _ESCAPE_TABLE
+        hex4_match = _HEX4_RE.match
+        parts: List[str] = []
+        append = parts.append
         while True:
-            if char is None:
-                raise JSONDecodeError("Unterminated string")
-
-            # Crazy gotcha. I didn't know "\n" and a literal newline were different things.
-            if ord(char) < 0x20:
-                raise JSONDecodeError("Unescaped control character in string")
+            # Everything up to the special character can be copied as is
+            append(s[i : m.start()])
+            char = m.group()
+            i = m.end()
 
             if char == '"':
                 break
-            elif char == "\\":
-                next = self._next()
-                if next is None:
-                    raise JSONDecodeError("\\ not followed by anything to escape")
-
-                if next == "u":
-                    hex_digits = ""
-                    for _ in range(4):
-                        hd = self._next()
-                        if hd is None or not (hd.isdigit() or hd.lower() in "abcdef"):
-                            raise JSONDecodeError("Invalid escape with \\u")
-
-                        hex_digits += hd
-
-                    s += chr(int(hex_digits, base=16))
-                else:
-                    try:
-                        s += self._ESCAPE_CHARACTERS[next]
-                    except:
-                        raise JSONDecodeError("Invalid escape")
+            # Crazy gotcha. I didn't know "\n" and a literal newline were different things.
+            elif char != "\\":
+                raise JSONDecodeError("Unescaped control character in string")
 
+            if i >= n:
+                raise JSONDecodeError("\\ not followed by anything to escape")
+            next = s[i]
+            i += 1
+
+            if next == "u":
+                if not hex4_match(s, i):
+                    raise JSONDecodeError("Invalid escape with \\u")
+                code = int(s[i : i + 4], 16)
+                i += 4
+
+                # A high surrogate followed by an escaped low surrogate is a
+                # UTF-16 pair for one character outside the BMP. Lone
+                # surrogates are kept as they are, like json.loads does.
+                if (
+                    0xD800 <= code <= 0xDBFF
+                    and s.startswith("\\u", i)
+                    and hex4_match(s, i + 2)
+                ):
+                    low = int(s[i + 2 : i + 6], 16)
+                    if 0xDC00 <= low <= 0xDFFF:
+                        code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                        i += 6
+
+                append(chr(code))
             else:
-                s += char
-
-            char = self._next()
+                code = ord(next)
+                escaped = escape_table[code] if code < 128 else ""
+                if not escaped:
+                    raise JSONDecodeError("Invalid escape")
+                append(escaped)
+
+            m = search(s, i)
+            if m is None:
+                raise JSONDecodeError("Unterminated string")
 
-        return s
+        return "".join(parts), i
 
     # Parse a number
-    def _parse_number(self) -> int | float:
-        s = ""
-        isFloat = False
-
-        while True:
-            char = self._peek()
-            if char is not None and not char.isspace() and char not in (",", "}", "]"):
-                if char == ".":
-                    isFloat = True
-                s += char
-                self._next()
-            else:
-                break
-
-        num: int | float = 0
-
-        # s[0] case is handled in the value parsing
-        if s[-1] == ".":
-            raise JSONDecodeError("Dot cannot be in the end")
-
-        if len(s) >= 2 and s[0] == "0" and s[1].isnumeric():
-            raise JSONDecodeError("Number cannot begin with 0")
-
-        try:
-            if isFloat:
-                num = float(s)
-            else:
-                num = int(s)
-        except:
-            raise JSONDecodeError("Invalid number")
-
-        return num
-
-    # Parse an array (of potentially different elements)
-    def _parse_array(self) -> List[Any]:
-        # if here, first char must be "["
-        # array elements can be anything
-        char = self._next()  # consume '['
-        arr: List[Any] = []
-        element: Any = None
-
-        while True:
-            self._skip_whitespace()
-            char = self._peek()  # handler must consume, so only peek here
-            if char is None:
-                raise JSONDecodeError("Array ends without ]")
-            if char == "]":
-                self._next()  # consume ']'
-                break
-
-            element = self._parse_one()
-            self._skip_whitespace()
-
-            char = self._peek()
-            if char == ",":
-                self._next()  # consume this comma
-                self._skip_whitespace()  # consume possible whitespace after comma
-                char = self._peek()
-                if char == ",":
-                    raise JSONDecodeError("Can't have two commas back to back")
-                elif char == "]":
-                    raise JSONDecodeError("Can't end with a trailing comma")
-                # the case where it's None so JSON ends without a '}'
-                # is handled in the next iteration so that is OK
-            elif (
-                char != "]"
-            ):  # if not comma, must be closing bracket, another element cant come
-                raise JSONDecodeError("Array elements must be separated with ,")
-
-            arr.append(element)
-
-        return arr
+    def _parse_number(self, i: int) -> tuple[int | float, int]:
+        s = self.content
+        m = _NUMBER_RE.match(s, i)
+
+        # The match must cover the whole token, so "01", "3." or "12a3" fail here
+        end = m.end() if m else i
+        if m is None or (end < self.n and s[end] not in _NUMBER_END):
+            raise self._number_error(i)
+
+        # Integers are by far the most common, and the regex already tells us
+        # whether there is a fraction or an exponent, so there is nothing left to
+        # scan. float() accepts any match, and so does int() unless the integer
+        # has more digits than Python's int/str conversion limit allows.
+        if m.lastindex is None:
+            if end - i > _INT_CHECK_DIGITS:
+                try:
+                    return int(m.group()), end
+                except ValueError:
+                    raise JSONDecodeError("Invalid number")
+            return int(m.group()), end
+        return float(m.group()), end
+
+    # Slow path, only taken for invalid numbers: find out what is wrong
+    def _number_error(self, i: int) -> JSONDecodeError:
+        s = self.content
+        end = i
+        while end < self.n and s[end] not in _NUMBER_END:
+            end += 1
+        literal = s[i:end]
+
+        if literal.endswith("."):
+            return JSONDecodeError("Dot cannot be in the end")
+        if _LEADING_ZERO_RE.match(literal):
+            return JSONDecodeError("Number cannot begin with 0")
+        return JSONDecodeError("Invalid number")
 
     # Parse "true", "false", or "null"
-    def _parse_literal(self) -> bool | None:
+    def _parse_literal(self, i: int) -> tuple[bool | None, int]:
         # if here, first letter must be "t", "f", or "n"
-        s = ""
-
-        while True:
-            char = self._peek()
-            if char is not None and not char.isspace() and char not in (",", "}", "]"):
-                s += char
-                self._next()
-            else:
-                break
-
-        if s == "true":
-            return True
-        elif s == "false":
-            return False
-        elif s == "null":
-            return None
+        # so the first letter alone decides which word it has to be
+        s = self.content
+        first = s[i]
+        value: bool | None
+        if first == "t" and s.startswith("true", i):
+            value, end = True, i + 4
+        elif first == "f" and s.startswith("false", i):
+            value, end = False, i + 5
+        elif first == "n" and s.startswith("null", i):
+            value, end = None, i + 4
         else:
             raise JSONDecodeError("Invalid literal syntax")
+
+        # Like a number, the word must end there, so "truex" is not "true"
+        if end < self.n and s[end] not in _NUMBER_END:
+            raise JSONDecodeError("Invalid literal syntax")
+        return value, end
@@ -0,0 +1,322 @@
+import re
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, Dict, List, overload
+
+from .decoder import _WS_RE, JSONDecodeError, JSONDecoder, _as_text
+
+# Everything up to the next bracket, stepping over whole strings so brackets
+# inside them are never seen. Stops at a bracket, at the end of the input, or
+# at the quote of a string that never terminates. One match consumes all the
+# values between two brackets, so the Python loop below runs per bracket rather
+# than per token.
+_UNTIL_BRACKET_RE = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+# A whole string, quotes included
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+# A number or literal: everything up to the next whitespace or punctuation. It
+# is only checked when it is accessed.
+_SCALAR_RE = re.compile(r'[^ \t\n\r,:\[\]{}"]*')
+
+
+# Decode lazily: nothing is scanned up front. Objects and arrays come back as
+# LazyObject / LazyArray views over the source string. A container is only
+# scanned when it is first accessed, and a value is only parsed when it is
+# accessed itself; containers that are stepped over only have their brackets
+# matched. A document whose top level is not a container is decoded right away
+# since there is nothing to defer.
+#
+# Note that this means syntax errors, including unbalanced brackets and extra
+# characters after the top-level container, are raised when the broken part is
+# accessed, not by decode_lazy.
+def decode_lazy(content: str | bytes | bytearray | memoryview) -> Any:
+    content = _as_text(content)
+    i = _skip_whitespace(content, 0)
+    if i == len(content) or content[i] not in "{[":
+        return JSONDecoder(content).decode()
+
+    doc = _Document(content, i)
+    if content[i] == "{":
+        return LazyObject(doc, i)
+    return LazyArray(doc, i)
+
+
+def _skip_whitespace(s: str, i: int) -> int:
+    m = _WS_RE.match(s, i)
+    return m.end() if m else i
+
+
+# Shared state of one lazily decoded document. All positions below are offsets
+# into src.
+class _Document:
+    __slots__ = ("src", "n", "root", "closing", "decoder")
+
+    def __init__(self, src: str, root: int) -> None:
+        self.src: str = src
+        self.n: int = len(src)
+        self.root: int = root  # offset of the top-level "{" or "["
+        # For every "{" or "[" found so far, the offset of its "}" or "]"
+        self.closing: Dict[int, int] = {}
+        # Parses the scalars (and fully materializes containers) in place
+        self.decoder: JSONDecoder = JSONDecoder(src)
+
+    # The character at offset i, or "" past the end of the input
+    def char(self, i: int) -> str:
+        return self.src[i] if i < self.n else ""
+
+    # Record that the container at start ends at offset end. Once the top-level
+    # container is closed, only whitespace may follow it.
+    def close(self, start: int, end: int) -> None:
+        self.closing[start] = end
+        if start == self.root and _skip_whitespace(self.src, end + 1) < self.n:
+            raise JSONDecodeError("Extra characters after JSON")
+
+    # Match the brackets of the container at start and of everything nested in
+    # it, which also checks that every string inside it terminates. Only done
+    # for containers that are stepped over.
+    def _match_brackets(self, start: int) -> None:
+        src = self.src
+        n = self.n
+        closing = self.closing
+        match = _UNTIL_BRACKET_RE.match
+        opened: List[int] = []
+        i = start
+
+        while True:
+            m = match(src, i)
+            if m:
+                i = m.end()
+            if i == n:
+                if src[opened[-1]] == "{":
+                    raise JSONDecodeError("Object ends without }")
+                raise JSONDecodeError("Array ends without ]")
+
+            char = src[i]
+            if char == "{" or char == "[":
+                opened.append(i)
+            elif char == '"':
+                raise JSONDecodeError("Unterminated string")
+            else:
+                q = opened.pop()  # never empty: the loop starts at a bracket
+                if src[q] + char not in ("{}", "[]"):
+                    raise JSONDecodeError("Mismatched brackets")
+                closing[q] = i
+                if not opened:
+                    return self.close(start, i)
+            i += 1
+
+    # Step over the value at offset i without parsing it. Returns the offset
+    # just past the value.
+    def skip(self, i: int) -> int:
+        src = self.src
+        char = self.char(i)
+        if char == "{" or char == "[":
+            if i not in self.closing:
+                self._match_brackets(i)
+            return self.closing[i] + 1
+        elif char == '"':
+            m = _STRING_RE.match(src, i)
+            if m is None:
+                raise JSONDecodeError("Unterminated string")
+            return m.end()
+
+        # A number or literal, checked when it is accessed
+        m = _SCALAR_RE.match(src, i)
+        if m is None or m.end() == i:
+            raise JSONDecodeError("Invalid JSON")  # e.g. [1,,2] or {"a": }
+        return m.end()
+
+    # Build the value at offset i
+    def value(self, i: int) -> Any:
+        char = self.src[i]
+        if char == "{":
+            return LazyObject(self, i)
+        elif char == "[":
+            return LazyArray(self, i)
+        elif char == '"':
+            return self.decoder._parse_string(i)[0]
+
+        # A number or literal, which must fill the whole gap skip() found
+        value, end = self.decoder._parse(i)
+        if end != self.skip(i):
+            raise JSONDecodeError("Invalid JSON")
+        return value
+
+    # Parse the whole container at offset i into dicts and lists, straight from
+    # the source
+    def materialize(self, i: int) -> Any:
+        value, end = self.decoder._parse(i)
+        self.close(i, end - 1)
+        return value
+
+
+class LazyObject(Mapping[str, Any]):
+    """A read-only JSON object that parses its members on access"""
+
+    __slots__ = ("_doc", "_start", "_cache", "_positions")
+
+    def __init__(self, doc: _Document, start: int) -> None:
+        self._doc = doc
+        self._start = start  # offset of "{"
+        self._cache: Dict[str, Any] = {}  # values that were already accessed
+        self._positions: Dict[str, int] | None = None  # key -> value offset
+
+    # Yield (key, value offset) for each member, checking the punctuation
+    # between them but not parsing any value. Keys without escapes come out as
+    # plain slices of the source; only keys with escapes need decoding.
+    def _members(self) -> Iterator[tuple[str, int]]:
+        doc = self._doc
+        src = doc.src
+        parse_string = doc.decoder._parse_string
+        i = _skip_whitespace(src, self._start + 1)
+        char = doc.char(i)
+
+        while char != "}":
+            if not char:
+                raise JSONDecodeError("Object ends without }")
+            elif char != '"':
+                raise JSONDecodeError("Keys must be strings")
+            key, colon = parse_string(i)
+            colon = _skip_whitespace(src, colon)
+            if doc.char(colon) != ":":
+                raise JSONDecodeError('Key not followed by ":"')
+
+            value = _skip_whitespace(src, colon + 1)
+            yield key, value
+
+            i = _skip_whitespace(src, doc.skip(value))
+            char = doc.char(i)
+            if char == ",":
+                i = _skip_whitespace(src, i + 1)
+                char = doc.char(i)
+                if char == "}":
+                    raise JSONDecodeError("Can't end with a trailing comma")
+            elif char and char != "}":
+                raise JSONDecodeError("Keys must be separated by , ")
+
+        doc.close(self._start, i)
+
+    def __getitem__(self, key: str) -> Any:
+        # Like a dict, a key of another type is just missing, so that "in" and
+        # get() (which only catch KeyError) work
+        if not isinstance(key, str):
+            raise KeyError(key)
+
+        cache = self._cache
+        if key in cache:
+            return cache[key]
+
+        found = self._key_positions().get(key, -1)
+        if found == -1:
+            raise KeyError(key)
+
+        value = cache[key] = self._doc.value(found)
+        return value
+
+    # Offset of every member's value, found in one walk over the object on the
+    # first access, so every later lookup (or miss) is a dict lookup. The last
+    # duplicate wins, like in a dict.
+    def _key_positions(self) -> Dict[str, int]:
+        if self._positions is None:
+            self._positions = dict(self._members())
+        return self._positions
+
+    # Answered from the key offsets, so the value is not parsed just to test
+    # for its key
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self._key_positions()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key_positions())
+
+    def __len__(self) -> int:
+        return len(self._key_positions())
+
+    def __repr__(self) -> str:
+        return f"LazyObject({self.materialize()!r})"
+
+    # Parse the whole object into a plain dict
+    def materialize(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = self._doc.materialize(self._start)
+        return result
+
+
+class LazyArray(Sequence[Any]):
+    """A read-only JSON array that parses its elements on access"""
+
+    __slots__ = ("_doc", "_start", "_cache", "_positions")
+
+    def __init__(self, doc: _Document, start: int) -> None:
+        self._doc = doc
+        self._start = start  # offset of "["
+        self._cache: Dict[int, Any] = {}  # elements that were already accessed
+        self._positions: List[int] | None = None
+
+    # Offset of every element, found by skipping over the elements (and
+    # everything nested in them) without parsing them
+    def _element_positions(self) -> List[int]:
+        if self._positions is not None:
+            return self._positions
+
+        doc = self._doc
+        src = doc.src
+        positions: List[int] = []
+        i = _skip_whitespace(src, self._start + 1)
+        char = doc.char(i)
+
+        while char != "]":
+            if not char:
+                raise JSONDecodeError("Array ends without ]")
+            positions.append(i)
+            i = _skip_whitespace(src, doc.skip(i))
+            char = doc.char(i)
+            if char == ",":
+                i = _skip_whitespace(src, i + 1)
+                char = doc.char(i)
+                if char == "]":
+                    raise JSONDecodeError("Can't end with a trailing comma")
+            elif char and char != "]":
+                raise JSONDecodeError("Array elements must be separated with ,")
+
+        doc.close(self._start, i)
+        self._positions = positions
+        return positions
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[k] for k in range(*index.indices(len(self)))]
+
+        positions = self._element_positions()
+        if index < 0:
+            index += len(positions)
+        if not 0 <= index < len(positions):
+            raise IndexError("LazyArray index out of range")
+
+        cache = self._cache
+        if index not in cache:
+            cache[index] = self._doc.value(positions[index])
+        return cache[index]
+
+    def __len__(self) -> int:
+        return len(self._element_positions())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, LazyArray)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyArray({self.materialize()!r})"
+
+    # Parse the whole array into a plain list
+    def materialize(self) -> List[Any]:
+        result: List[Any] = self._doc.materialize(self._start)
+        return result
@@ -1,13 +1,118 @@
 import pytest
 import json
+import sys
+import functools
 from typing import Any
 
 from json_decoder.decoder import JSONDecoder, JSONDecodeError
 
+# One decoder for the whole run, pointed at each input with reset()
+_DECODER: JSONDecoder = JSONDecoder("")
 
-def decode_with_my_impl(s: str) -> Any:
-    decoder: JSONDecoder = JSONDecoder(s)
-    return decoder.decode()
+
+def decode_with_my_impl(s: str | bytes | bytearray | memoryview) -> Any:
+    return _DECODER.reset(s).decode()
+
+
+# Inputs of the larger parity tests. Their json.loads values are computed once,
+# at import, into GOLDEN.
+_REALISTIC_JSON: str = """
+    {
+      "users": [
+        {
+          "id": 1,
+          "name": "John Doe",
+          "roles": ["admin","user"],
+          "active": true
+        },
+        {
+          "id": 2,
+          "name": "Jane \\u0043on",
+          "roles": [],
+          "active": false
+        }
+      ],
+      "count": 2,
+      "next": null
+    }
+    """
+
+_MIXED_DEEP_JSON: str = """
+    {
+      "users": [
+        {"id": 1, "name": "A", "prefs": {"langs": ["py","js"], "active": true}},
+        {"id": 2, "name": "B", "prefs": {"langs": [], "active": false}}
+      ],
+      "meta": {"count": 2, "description": null},
+      "values": [1, 2.5, {"nestedArr": [[], [3]]}, []]
+    }
+    """
+
+_DEEP_ARRAY_20: str = '{"a": ' + ("[" * 20) + "1" + ("]" * 20) + "}"
+_DEEP_ARRAY_100: str = '{"data": ' + "[" * 100 + "42" + "]" * 100 + "}"
+_DEEP_OBJECT_50: str = '{"level": ' + '{"next": ' * 50 + "null" + "}" * 50 + "}"
+
+# 5 levels of nested objects, each containing a key "b" whose value is
+# 5 levels of nested empty arrays. Total depth: {"a": {"b": {"b": {"b": {"b": [[[[[]]]]]}}}}}
+_NESTED_EMPTY_DEEP: str = '{"a": ' + '{"b": ' * 5 + "[" * 5 + "]" * 5 + "}" * 5 + "}"
+
+# The integers 0..n-1 as comma separated JSON text
+_RANGE100_CSV: str = ",".join(map(str, range(100)))
+_RANGE1000_CSV: str = ",".join(map(str, range(1000)))
+
+_LARGE_ARRAY_1000: str = "[" + _RANGE1000_CSV + "]"
+_LARGE_ARRAY_JSON: str = '{"numbers": ' + _LARGE_ARRAY_1000 + "}"
+
+# Many keys in single object
+_MANY_KEYS_100: str = "{" + ", ".join(f'"key{i}": {i}' for i in range(100)) + "}"
+
+# Long array of varied types
+_LONG_MIXED: str = (
+    '{"data": ['
+    + ", ".join(["null", "true", "false", "42", '"string"', "[]", "{}"] * 50)
+    + "]}"
+)
+
+# A long string mixing literal Unicode characters and surrogate-escaped sequences
+_LITERAL_UNICODE: str = "漢字テスト" * 100
+_LONG_UNICODE_JSON: str = '{"long": "' + _LITERAL_UNICODE + r"\u4E00\u4E8C\u4E09" + '"}'
+
+
+# Generate a large, complex JSON structure. Equal subtrees are built only once.
+@functools.cache
+def _generate_nested_structure(depth: int, width: int) -> str:
+    if depth == 0:
+        return str(depth)
+
+    child = _generate_nested_structure(depth - 1, width)
+    items = [
+        (
+            f'"key{i}": {child}'
+            if i % 3 == 0
+            else f'"key{i}": [{child}]' if i % 3 == 1 else f'"key{i}": "value{i}"'
+        )
+        for i in range(width)
+    ]
+    return "{" + ", ".join(items) + "}"
+
+
+# Generate moderately complex structure
+_STRESS_JSON: str = _generate_nested_structure(4, 3)
+
+VALID_INPUTS: tuple[str, ...] = (
+    _REALISTIC_JSON,
+    _MIXED_DEEP_JSON,
+    _DEEP_ARRAY_20,
+    _DEEP_ARRAY_100,
+    _DEEP_OBJECT_50,
+    _NESTED_EMPTY_DEEP,
+    _LARGE_ARRAY_JSON,
+    _MANY_KEYS_100,
+    _LONG_MIXED,
+    _LONG_UNICODE_JSON,
+    _STRESS_JSON,
+)
+GOLDEN: dict[str, Any] = {s: json.loads(s) for s in VALID_INPUTS}
 
 
 def test_empty_input_raises() -> None:
@@ -32,9 +137,7 @@ def test_simple_empty_object_and_extra_characters() -> None:
 
 def test_simple_key_string_value() -> None:
     s: str = '{"name": "Alice"}'
-    my_impl: Any = decode_with_my_impl(s)
-    builtin: Any = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(s) == json.loads(s)
 
     s2: str = '{"age":30}'
     assert decode_with_my_impl(s2) == json.loads(s2)
@@ -61,14 +164,10 @@ def test_nested_objects() -> None:
 
 def test_string_escaped_characters() -> None:
     s: str = r'{"text": "Line1\nLine2\t\\\"End\""}'
-    my_impl: Any = decode_with_my_impl(s)
-    builtin: Any = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(s) == json.loads(s)
 
     s2: str = r'{"u": "\u0041\u00DF"}'
-    my_impl2: Any = decode_with_my_impl(s2)
-    builtin2: Any = json.loads(s2)
-    assert my_impl2 == builtin2
+    assert decode_with_my_impl(s2) == json.loads(s2)
 
     with pytest.raises(JSONDecodeError):
         decode_with_my_impl('{"a": "unterminated}')
@@ -108,6 +207,17 @@ def test_boolean_and_null_literals() -> None:
         decode_with_my_impl('{"bad": tru}')
 
 
+# Literals with trailing characters (more are in _INVALID_LITERAL_CASES)
+_TRAILING_LETTER_LITERAL_CASES: tuple[str, ...] = ("falsey", '{"a": null"b"}')
+
+
+@pytest.mark.parametrize("case", _TRAILING_LETTER_LITERAL_CASES)
+def test_literal_with_trailing_characters(case: str) -> None:
+    # Reported as a bad literal, not as a missing comma
+    with pytest.raises(JSONDecodeError, match="Invalid literal syntax"):
+        decode_with_my_impl(case)
+
+
 def test_simple_and_nested_arrays() -> None:
     s: str = '{"arr": []}'
     assert decode_with_my_impl(s) == json.loads(s)
@@ -153,27 +263,7 @@ def test_invalid_value_type() -> None:
 
 
 def test_complex_realistic_json() -> None:
-    s: str = """
-    {
-      "users": [
-        {
-          "id": 1,
-          "name": "John Doe",
-          "roles": ["admin","user"],
-          "active": true
-        },
-        {
-          "id": 2,
-          "name": "Jane \\u0043on",
-          "roles": [],
-          "active": false
-        }
-      ],
-      "count": 2,
-      "next": null
-    }
-    """
-    assert decode_with_my_impl(s) == json.loads(s)
+    assert decode_with_my_impl(_REALISTIC_JSON) == GOLDEN[_REALISTIC_JSON]
 
 
 def test_whitespace_variations_everywhere() -> None:
@@ -182,13 +272,10 @@ def test_whitespace_variations_everywhere() -> None:
 
 
 def test_deep_nesting_and_large_array() -> None:
-    deep: str = '{"a": ' + ("[" * 20) + "1" + ("]" * 20) + "}"
-    assert decode_with_my_impl(deep) == json.loads(deep)
+    assert decode_with_my_impl(_DEEP_ARRAY_20) == GOLDEN[_DEEP_ARRAY_20]
 
-    large_list: list[int] = list(range(100))
-    builtin_obj: dict[str, Any] = {"nums": large_list}
-    s2: str = '{"nums": [' + ",".join(str(n) for n in large_list) + "]}"
-    assert decode_with_my_impl(s2) == builtin_obj
+    s2: str = '{"nums": [' + _RANGE100_CSV + "]}"
+    assert decode_with_my_impl(s2) == {"nums": list(range(100))}
 
 
 def test_invalid_json_extra_characters_midway() -> None:
@@ -281,25 +368,35 @@ def test_empty_string_key_and_value() -> None:
 def test_string_with_all_escape_sequences() -> None:
     # Combine \b, \f, \n, \r, \t, \\, \/, \"
     s = r'{"escapes": "\b\f\n\r\t\\/\""}'
-    my_impl = decode_with_my_impl(s)
-    builtin = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(s) == json.loads(s)
 
 
 def test_unicode_4hex_escape_and_combined_characters() -> None:
     # 4‐hex escapes: \u0041 is 'A'; also mixing literal Unicode
     s = '{"letter": "\\u0041", "cyrillic": "Ч"}'
-    my_impl = decode_with_my_impl(s)
-    builtin = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(s) == json.loads(s)
+
+
+def test_unicode_escape_surrogate_pairs() -> None:
+    # An escaped UTF-16 pair is combined into one character outside the BMP
+    s = r'{"emoji": "\uD83D\uDE00", "clef": "x\ud834\udd1ey"}'
+    result = decode_with_my_impl(s)
+    assert result == json.loads(s)
+    assert result["emoji"] == "\U0001f600"
+
+    # Lone or mismatched surrogates are kept as is, like json.loads does
+    s2 = r'["\uD83D", "\uDE00", "\uD83D\u0041", "\uD83D\uD83D"]'
+    assert decode_with_my_impl(s2) == json.loads(s2)
+
+    # Only ASCII hex digits count
+    with pytest.raises(JSONDecodeError):
+        decode_with_my_impl('"\\u00\u0663A"')
 
 
 def test_number_fraction_and_zero_prefix() -> None:
     # Valid fractional number with leading zero
     s = '{"frac": 0.001, "neg_frac": -0.010}'
-    my_impl = decode_with_my_impl(s)
-    builtin = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(s) == json.loads(s)
 
     # Invalid: leading dot not allowed
     with pytest.raises(JSONDecodeError):
@@ -314,20 +411,29 @@ def test_number_fraction_and_zero_prefix() -> None:
         decode_with_my_impl('{"bad": 1.2.3}')
 
 
-def test_number_scientific_notation_not_supported() -> None:
-    # The my_impl parser does not support 'e' or 'E' exponents—should raise
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"exp": 1e10}')
+def test_number_scientific_notation() -> None:
+    # 'e' and 'E' exponents, with or without a sign, decode to floats
+    s = '{"exp": 1e10, "neg": -2E-5, "plus": 3e+2}'
+    assert decode_with_my_impl(s) == json.loads(s)
+
+    # Exponents after a fraction
+    assert decode_with_my_impl("1.5e3") == 1500.0
+    assert decode_with_my_impl('{"a": 1.0E+2}') == {"a": 100.0}
+
+
+# An exponent needs digits, and the mantissa still needs digits after a dot
+_INVALID_EXPONENT_CASES: tuple[str, ...] = ("1e", "1E+", "1.e3", "1e1.5")
 
+
+@pytest.mark.parametrize("case", _INVALID_EXPONENT_CASES)
+def test_number_invalid_exponent(case: str) -> None:
     with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"exp": -2E-5}')
+        decode_with_my_impl(case)
 
 
 def test_array_with_mixed_whitespace_and_types() -> None:
     s = '{   "mixed": [  123  ,   "hello"   ,null,  [true,false ],  { "k": 0 }  ]  }'
-    my_impl = decode_with_my_impl(s)
-    builtin = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(s) == json.loads(s)
 
     # Array with only whitespace and then closing bracket is valid
     s2 = '{"emptyArr": [   ]}'
@@ -335,54 +441,54 @@ def test_array_with_mixed_whitespace_and_types() -> None:
 
 
 def test_nested_empty_objects_and_arrays_deep() -> None:
-    # 5 levels of nested objects, each containing a key "b" whose value is
-    # 5 levels of nested empty arrays. Total depth: {"a": {"b": {"b": {"b": {"b": [[[[[]]]]]}}}}}
-    deep = '{"a": ' + '{"b": ' * 5 + "[" * 5 + "]" * 5 + "}" * 5 + "}"
-
     # Just verify that your decoder matches json.loads - that's the real test!
-    expected = json.loads(deep)
-    result = decode_with_my_impl(deep)
+    expected = GOLDEN[_NESTED_EMPTY_DEEP]
+    result = decode_with_my_impl(_NESTED_EMPTY_DEEP)
     assert result == expected
 
 
-def test_object_with_many_keys_and_varied_types() -> None:
-    # Create an object with 50 keys programmatically
+# Create an object with 50 keys programmatically, once for the module
+@pytest.fixture(scope="module")
+def many_keys_object() -> tuple[str, dict[str, Any]]:
     pairs: list[str] = []
+    expected: dict[str, Any] = {}
     for i in range(50):
+        # Each value is written out as JSON text next to the value it decodes to
+        text: str
         value: Any
         if i % 5 == 0:
-            value = "string" + str(i)
+            text, value = f'"string{i}"', f"string{i}"
         elif i % 5 == 1:
-            value = i
+            text, value = str(i), i
         elif i % 5 == 2:
-            value = True
+            text, value = "true", True
         elif i % 5 == 3:
-            value = None
+            text, value = "null", None
         else:
-            value = [i, {"nested": i * 2}]
-        # For strings, wrap in quotes; for others, rely on json.dumps
-        if isinstance(value, str):
-            pairs.append(f'"key{i}": "{value}"')
-        else:
-            pairs.append(f'"key{i}": {json.dumps(value)}')
-    body = "{ " + ", ".join(pairs) + " }"
-    my_impl = decode_with_my_impl(body)
-    builtin = json.loads(body)
-    assert my_impl == builtin
+            text, value = f'[{i}, {{"nested": {i * 2}}}]', [i, {"nested": i * 2}]
+        pairs.append(f'"key{i}": {text}')
+        expected[f"key{i}"] = value
+    return "{ " + ", ".join(pairs) + " }", expected
 
 
-def test_invalid_literals_and_wrong_keyword() -> None:
-    # 'Truth' is not a valid literal
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"a": Truth}')
+def test_object_with_many_keys_and_varied_types(
+    many_keys_object: tuple[str, dict[str, Any]],
+) -> None:
+    body, expected = many_keys_object
+    assert decode_with_my_impl(body) == expected
+
+
+_WRONG_KEYWORD_CASES: tuple[str, ...] = (
+    '{"a": Truth}',  # 'Truth' is not a valid literal
+    '{"a": nu}',  # Partial 'nul' without 'l'
+    '{"a": abc}',  # Random letters where value expected
+)
 
-    # Partial 'nul' without 'l'
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"a": nu}')
 
-    # Random letters where value expected
+@pytest.mark.parametrize("case", _WRONG_KEYWORD_CASES)
+def test_invalid_literals_and_wrong_keyword(case: str) -> None:
     with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"a": abc}')
+        decode_with_my_impl(case)
 
 
 def test_object_missing_quotes_around_key() -> None:
@@ -395,18 +501,17 @@ def test_object_missing_quotes_around_key() -> None:
         decode_with_my_impl("{'a': 1}")
 
 
-def test_array_errors_extra_commas_and_missing_commas() -> None:
-    # Double commas in array
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"arr": [1,,2]}')
+_ARRAY_COMMA_CASES: tuple[str, ...] = (
+    '{"arr": [1,,2]}',  # Double commas in array
+    '{"arr": [1 2]}',  # Missing comma between elements
+    '{"arr": [1,2,]}',  # Trailing comma before bracket
+)
 
-    # Missing comma between elements
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"arr": [1 2]}')
 
-    # Trailing comma before bracket
+@pytest.mark.parametrize("case", _ARRAY_COMMA_CASES)
+def test_array_errors_extra_commas_and_missing_commas(case: str) -> None:
     with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"arr": [1,2,]}')
+        decode_with_my_impl(case)
 
 
 def test_unescaped_control_in_string_is_error() -> None:
@@ -416,60 +521,55 @@ def test_unescaped_control_in_string_is_error() -> None:
         decode_with_my_impl(s)
 
 
-def test_multiple_branches_of_malformed_input() -> None:
-    # Completely invalid JSON
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl("@#$%^&*")
-
-    # Missing colon
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"a" 1}')
-
-    # Missing closing quote in key
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"a: 1}')
+_MALFORMED_CASES: tuple[str, ...] = (
+    "@#$%^&*",  # Completely invalid JSON
+    '{"a" 1}',  # Missing colon
+    '{"a: 1}',  # Missing closing quote in key
+    '{"a": 1 "b": 2}',  # Missing comma between key/value pairs
+    '{"a": 1}}',  # Unexpected character after object close
+)
 
-    # Missing comma between key/value pairs
-    with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"a": 1 "b": 2}')
 
-    # Unexpected character after object close
+@pytest.mark.parametrize("case", _MALFORMED_CASES)
+def test_multiple_branches_of_malformed_input(case: str) -> None:
     with pytest.raises(JSONDecodeError):
-        decode_with_my_impl('{"a": 1}}')
+        decode_with_my_impl(case)
 
 
 def test_large_integer_values() -> None:
     # JSON allows arbitrarily large integers; my_impl uses Python int, so it should work
     large = 10**30
     s = f'{{"big": {large}}}'
-    my_impl = decode_with_my_impl(s)
-    builtin = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(s) == json.loads(s)
+
+
+def test_integer_over_int_conversion_limit() -> None:
+    # Longer than what int() converts by default; json.loads rejects it too
+    with pytest.raises(JSONDecodeError):
+        decode_with_my_impl("1" * 5000)
+
+    with pytest.raises(JSONDecodeError):
+        decode_with_my_impl('{"big": [-' + "9" * 5000 + "]}")
 
 
 def test_mixed_deep_structure_combined() -> None:
-    s = """
-    {
-      "users": [
-        {"id": 1, "name": "A", "prefs": {"langs": ["py","js"], "active": true}},
-        {"id": 2, "name": "B", "prefs": {"langs": [], "active": false}}
-      ],
-      "meta": {"count": 2, "description": null},
-      "values": [1, 2.5, {"nestedArr": [[], [3]]}, []]
-    }
-    """
-    my_impl = decode_with_my_impl(s)
-    builtin = json.loads(s)
-    assert my_impl == builtin
+    assert decode_with_my_impl(_MIXED_DEEP_JSON) == GOLDEN[_MIXED_DEEP_JSON]
 
 
 def test_extreme_nesting_depth() -> None:
     # Test very deep nesting (100 levels)
-    deep_array = '{"data": ' + "[" * 100 + "42" + "]" * 100 + "}"
-    assert decode_with_my_impl(deep_array) == json.loads(deep_array)
+    assert decode_with_my_impl(_DEEP_ARRAY_100) == GOLDEN[_DEEP_ARRAY_100]
+    assert decode_with_my_impl(_DEEP_OBJECT_50) == GOLDEN[_DEEP_OBJECT_50]
 
-    deep_object = '{"level": ' + '{"next": ' * 50 + "null" + "}" * 50 + "}"
-    assert decode_with_my_impl(deep_object) == json.loads(deep_object)
+
+def test_nesting_deeper_than_recursion_limit() -> None:
+    # Containers are tracked on an explicit stack, not the Python call stack
+    depth = sys.getrecursionlimit() * 10
+    result = decode_with_my_impl('{"a": ' * depth + "[]" + "}" * depth)
+    for _ in range(depth):
+        assert list(result) == ["a"]
+        result = result["a"]
+    assert result == []
 
 
 def test_edge_case_numbers() -> None:
@@ -506,31 +606,43 @@ def test_complex_string_escapes() -> None:
         decode_with_my_impl('{"bad": "\\u123"}')  # Only 3 hex digits
 
 
-def test_whitespace_edge_cases() -> None:
-    # Test all types of whitespace
-    whitespaces = [" ", "\t", "\n", "\r"]
-    for ws in whitespaces:
-        s = f'{{{ws}"key"{ws}:{ws}"value"{ws}}}'
-        assert decode_with_my_impl(s) == json.loads(s)
+# Test all types of whitespace
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("{" + ws + '"key"' + ws + ":" + ws + '"value"' + ws + "}", {"key": "value"})
+        for ws in (" ", "\t", "\n", "\r")
+    ],
+)
+def test_whitespace_edge_cases(s: str, expected: dict[str, str]) -> None:
+    assert decode_with_my_impl(s) == expected
+
 
+def test_mixed_whitespace_edge_cases() -> None:
     # Mixed whitespace
     s = '{\n\t  "mixed"  \r\n:\t\t[\n   1,\r2   ,\t\n3\r\n]\n}'
     assert decode_with_my_impl(s) == json.loads(s)
 
 
-def test_empty_containers_variations() -> None:
-    # Various empty container patterns
-    test_cases = [
-        "{}",
-        '{"empty_obj": {}}',
-        '{"empty_arr": []}',
-        '{"nested_empty": {"inner": {}}}',
-        '{"mixed": [[], {}, [], {}]}',
-        '{"deep_empty": [[[[{}]]]]}',
-    ]
+# Various empty container patterns
+_EMPTY_CONTAINER_CASES: tuple[str, ...] = (
+    "{}",
+    '{"empty_obj": {}}',
+    '{"empty_arr": []}',
+    '{"nested_empty": {"inner": {}}}',
+    '{"mixed": [[], {}, [], {}]}',
+    '{"deep_empty": [[[[{}]]]]}',
+)
 
-    for case in test_cases:
-        assert decode_with_my_impl(case) == json.loads(case)
+
+@pytest.mark.parametrize("case", _EMPTY_CONTAINER_CASES)
+def test_empty_containers_variations(case: str) -> None:
+    assert decode_with_my_impl(case) == json.loads(case)
+
+
+_LONG_STR: str = "a" * 10000
+_LONG_JSON: str = '{"long": "' + _LONG_STR + '"}'
+_LONG_EXPECTED: dict[str, str] = {"long": _LONG_STR}
 
 
 def test_string_boundary_cases() -> None:
@@ -539,47 +651,45 @@ def test_string_boundary_cases() -> None:
     assert decode_with_my_impl(s) == json.loads(s)
 
     # Very long string
-    long_str = "a" * 10000
-    s2 = f'{{"long": "{long_str}"}}'
-    assert decode_with_my_impl(s2) == json.loads(s2)
+    assert decode_with_my_impl(_LONG_JSON) == _LONG_EXPECTED
 
     # String with only escaped characters
     s3 = r'{"escaped": "\"\\\b\f\n\r\t"}'
     assert decode_with_my_impl(s3) == json.loads(s3)
 
 
-def test_array_edge_cases() -> None:
-    # Single element arrays
-    test_cases = [
-        '{"arr": [1]}',
-        '{"arr": ["single"]}',
-        '{"arr": [true]}',
-        '{"arr": [null]}',
-        '{"arr": [{}]}',
-        '{"arr": [[]]}',
-    ]
+# Single element arrays
+_SINGLE_ELEMENT_ARRAY_CASES: tuple[str, ...] = (
+    '{"arr": [1]}',
+    '{"arr": ["single"]}',
+    '{"arr": [true]}',
+    '{"arr": [null]}',
+    '{"arr": [{}]}',
+    '{"arr": [[]]}',
+)
 
-    for case in test_cases:
+
+def test_array_edge_cases() -> None:
+    for case in _SINGLE_ELEMENT_ARRAY_CASES:
         assert decode_with_my_impl(case) == json.loads(case)
 
     # Large arrays
-    large_array = "[" + ",".join(str(i) for i in range(1000)) + "]"
-    s = f'{{"numbers": {large_array}}}'
-    assert decode_with_my_impl(s) == json.loads(s)
+    assert decode_with_my_impl(_LARGE_ARRAY_JSON) == GOLDEN[_LARGE_ARRAY_JSON]
 
 
-def test_object_key_variations() -> None:
-    # Various valid key formats
-    test_cases = [
-        '{"": "empty_key"}',  # Empty string key
-        '{"a": 1, "b": 2, "c": 3}',  # Multiple keys
-        '{"key with spaces": "value"}',
-        '{"key\\nwith\\tescapes": "value"}',
-        '{"\\u0048\\u0065\\u006c\\u006c\\u006f": "unicode_key"}',
-    ]
+# Various valid key formats
+_KEY_VARIATION_CASES: tuple[str, ...] = (
+    '{"": "empty_key"}',  # Empty string key
+    '{"a": 1, "b": 2, "c": 3}',  # Multiple keys
+    '{"key with spaces": "value"}',
+    '{"key\\nwith\\tescapes": "value"}',
+    '{"\\u0048\\u0065\\u006c\\u006c\\u006f": "unicode_key"}',
+)
 
-    for case in test_cases:
-        assert decode_with_my_impl(case) == json.loads(case)
+
+@pytest.mark.parametrize("case", _KEY_VARIATION_CASES)
+def test_object_key_variations(case: str) -> None:
+    assert decode_with_my_impl(case) == json.loads(case)
 
 
 def test_mixed_type_arrays() -> None:
@@ -592,27 +702,42 @@ def test_mixed_type_arrays() -> None:
     assert decode_with_my_impl(s2) == json.loads(s2)
 
 
-def test_error_recovery_boundaries() -> None:
-    # Test errors at different parsing stages
-    error_cases = [
-        "",  # Empty input
-        "{",  # Unclosed object
-        '{"key"',  # Missing colon and value
-        '{"key":',  # Missing value
-        '{"key": "value"',  # Missing closing brace
-        '{"key": "value",',  # Trailing comma
-        '{"key": "value", "key2"',  # Second key missing colon
-        "[",  # Unclosed array
-        "[1",  # Missing closing bracket
-        "[1,",  # Trailing comma in array
-        "[1,,2]",  # Double comma
-        '{"key": [}',  # Mismatched brackets
-        '{"key": ]}',  # Wrong closing bracket
-    ]
-
-    for case in error_cases:
-        with pytest.raises(JSONDecodeError):
-            decode_with_my_impl(case)
+# Errors at different parsing stages
+_ERROR_CASES: tuple[str, ...] = (
+    "",  # Empty input
+    "{",  # Unclosed object
+    '{"key"',  # Missing colon and value
+    '{"key":',  # Missing value
+    '{"key": "value"',  # Missing closing brace
+    '{"key": "value",',  # Trailing comma
+    '{"key": "value", "key2"',  # Second key missing colon
+    "[",  # Unclosed array
+    "[1",  # Missing closing bracket
+    "[1,",  # Trailing comma in array
+    "[1,,2]",  # Double comma
+    '{"key": [}',  # Mismatched brackets
+    '{"key": ]}',  # Wrong closing bracket
+)
+
+
+@pytest.mark.parametrize("case", _ERROR_CASES)
+def test_error_recovery_boundaries(case: str) -> None:
+    with pytest.raises(JSONDecodeError):
+        decode_with_my_impl(case)
+
+
+# Invalid literal variations
+_INVALID_LITERAL_CASES: tuple[str, ...] = (
+    '{"bad": True}',  # Wrong capitalization
+    '{"bad": FALSE}',  # Wrong capitalization
+    '{"bad": NULL}',  # Wrong capitalization
+    '{"bad": tru}',  # Incomplete
+    '{"bad": fals}',  # Incomplete
+    '{"bad": nul}',  # Incomplete
+    '{"bad": truex}',  # Extra characters
+    '{"bad": falsex}',  # Extra characters
+    '{"bad": nullx}',  # Extra characters
+)
 
 
 def test_literal_parsing_edge_cases() -> None:
@@ -625,19 +750,7 @@ def test_literal_parsing_edge_cases() -> None:
     assert decode_with_my_impl(s2) == json.loads(s2)
 
     # Invalid literal variations
-    invalid_literals = [
-        '{"bad": True}',  # Wrong capitalization
-        '{"bad": FALSE}',  # Wrong capitalization
-        '{"bad": NULL}',  # Wrong capitalization
-        '{"bad": tru}',  # Incomplete
-        '{"bad": fals}',  # Incomplete
-        '{"bad": nul}',  # Incomplete
-        '{"bad": truex}',  # Extra characters
-        '{"bad": falsex}',  # Extra characters
-        '{"bad": nullx}',  # Extra characters
-    ]
-
-    for case in invalid_literals:
+    for case in _INVALID_LITERAL_CASES:
         with pytest.raises(JSONDecodeError):
             decode_with_my_impl(case)
 
@@ -667,25 +780,7 @@ def test_structure_variations() -> None:
 
 
 def test_stress_test_large_structure() -> None:
-    # Generate a large, complex JSON structure
-    def generate_nested_structure(depth: int, width: int) -> str:
-        if depth == 0:
-            return str(depth)
-
-        items: list[str] = []  # Explicitly type the list
-        for i in range(width):
-            if i % 3 == 0:
-                items.append(f'"key{i}": {generate_nested_structure(depth-1, width)}')
-            elif i % 3 == 1:
-                items.append(f'"key{i}": [{generate_nested_structure(depth-1, width)}]')
-            else:
-                items.append(f'"key{i}": "value{i}"')
-
-        return "{" + ", ".join(items) + "}"
-
-    # Generate moderately complex structure
-    complex_json = generate_nested_structure(4, 3)
-    assert decode_with_my_impl(complex_json) == json.loads(complex_json)
+    assert decode_with_my_impl(_STRESS_JSON) == GOLDEN[_STRESS_JSON]
 
 
 def test_pathological_cases() -> None:
@@ -694,16 +789,10 @@ def test_pathological_cases() -> None:
     assert decode_with_my_impl(alternating) == json.loads(alternating)
 
     # Many keys in single object
-    many_keys = "{" + ", ".join(f'"key{i}": {i}' for i in range(100)) + "}"
-    assert decode_with_my_impl(many_keys) == json.loads(many_keys)
+    assert decode_with_my_impl(_MANY_KEYS_100) == GOLDEN[_MANY_KEYS_100]
 
     # Long array of varied types
-    long_mixed = (
-        '{"data": ['
-        + ", ".join(["null", "true", "false", "42", '"string"', "[]", "{}"] * 50)
-        + "]}"
-    )
-    assert decode_with_my_impl(long_mixed) == json.loads(long_mixed)
+    assert decode_with_my_impl(_LONG_MIXED) == GOLDEN[_LONG_MIXED]
 
 
 def test_duplicate_keys_overwrite_behavior() -> None:
@@ -717,6 +806,45 @@ def test_duplicate_keys_overwrite_behavior() -> None:
     assert result["b"] == 2
 
 
+def test_repeated_keys_share_one_string() -> None:
+    result = decode_with_my_impl('[{"name": 1}, {"name": 2, "id": 3}]')
+    first_key = next(iter(result[0]))
+    second_key = next(iter(result[1]))
+    assert first_key == second_key == "name"
+    assert first_key is second_key
+
+
+def test_value_intern_shares_repeated_string_values() -> None:
+    s: str = '[{"type": "User"}, {"type": "User"}, {"type": "Organization"}]'
+    result = JSONDecoder(s, value_intern=True).decode()
+    assert result == json.loads(s)
+    assert result[0]["type"] is result[1]["type"]
+
+
+def test_utf8_bytes_input() -> None:
+    raw: bytes = '{"name": "Zoë", "tags": ["漢字", "\\u00e9"]}'.encode("utf-8")
+    assert decode_with_my_impl(raw) == json.loads(raw)
+    assert decode_with_my_impl(bytearray(raw)) == json.loads(raw)
+    assert decode_with_my_impl(memoryview(raw)) == json.loads(raw)
+
+    # A UTF-8 byte order mark is skipped, like json.loads does for bytes
+    assert decode_with_my_impl(b"\xef\xbb\xbf" + raw) == json.loads(raw)
+
+    with pytest.raises(JSONDecodeError):
+        decode_with_my_impl(b'{"bad": "\xff"}')
+
+
+def test_reset_reuses_decoder() -> None:
+    decoder: JSONDecoder = JSONDecoder('{"a": 1}')
+    assert decoder.decode() == {"a": 1}
+    assert decoder.reset("[1, 2]").decode() == [1, 2]
+
+    # A failed parse leaves nothing behind for the next input
+    with pytest.raises(JSONDecodeError):
+        decoder.reset('{"a": [1, 2').decode()
+    assert decoder.reset(' "ok" ').decode() == "ok"
+
+
 def test_invalid_leading_plus_in_number() -> None:
     # A leading plus sign is not allowed in JSON numbers
     with pytest.raises(JSONDecodeError):
@@ -729,6 +857,16 @@ def test_lonely_minus_sign_is_invalid() -> None:
         decode_with_my_impl('"-": -')
 
 
+# int() and float() accept these, JSON does not
+_PYTHON_ONLY_NUMBER_CASES: tuple[str, ...] = ("-01", "1_000", "-.5", "٣")
+
+
+@pytest.mark.parametrize("case", _PYTHON_ONLY_NUMBER_CASES)
+def test_number_rejects_python_only_syntax(case: str) -> None:
+    with pytest.raises(JSONDecodeError):
+        decode_with_my_impl(case)
+
+
 def test_nonbreaking_space_instead_of_whitespace() -> None:
     # U+00A0 (non-breaking space) is not recognized as whitespace by the parser
     # json.loads also errors on this
@@ -906,13 +1044,10 @@ def test_array_with_only_whitespace_and_commas_error() -> None:
 
 
 def test_long_string_with_embedded_surrogates_and_literals() -> None:
-    # A long string mixing literal Unicode characters and surrogate-escaped sequences
-    literal_unicode = "漢字テスト" * 100
-    s = '{"long": "' + literal_unicode + r"\u4E00\u4E8C\u4E09" + '"}'
-    expected = json.loads(s)
-    result = decode_with_my_impl(s)
+    expected = GOLDEN[_LONG_UNICODE_JSON]
+    result = decode_with_my_impl(_LONG_UNICODE_JSON)
     assert result == expected
-    assert literal_unicode in result["long"]
+    assert _LITERAL_UNICODE in result["long"]
 
 
 def test_object_key_with_control_characters_error() -> None:
@@ -0,0 +1,157 @@
+import pytest
+import json
+from typing import Any
+
+from json_decoder.decoder import JSONDecodeError
+from json_decoder.lazy import LazyArray, LazyObject, decode_lazy
+
+
+def test_lazy_object_field_access() -> None:
+    s: str = '{"name": "Alice", "age": 30, "tags": ["a", "b"], "meta": {"ok": true}}'
+    obj: Any = decode_lazy(s)
+    assert isinstance(obj, LazyObject)
+    assert obj["name"] == "Alice"
+    assert obj["age"] == 30
+    assert isinstance(obj["tags"], LazyArray)
+    assert obj["tags"][1] == "b"
+    assert obj["meta"]["ok"] is True
+    assert obj.get("missing") is None
+
+    with pytest.raises(KeyError):
+        obj["missing"]
+
+    # Keys of other types are missing, as in a dict
+    fresh: Any = decode_lazy(s)
+    assert 5 not in fresh
+    assert fresh.get(5) is None
+    assert fresh.get(None, "default") == "default"
+
+
+def test_lazy_matches_builtin() -> None:
+    s: str = """
+    {
+        "outer": {"inner": {"x": -5, "y": [true, false, null, 1.5]}},
+        "list": [[], {}, [[1], {"k": "v\\n\\u0041"}]],
+        "empty": "",
+        "\\u006bey": "escaped key"
+    }
+    """
+    obj: Any = decode_lazy(s)
+    expected: Any = json.loads(s)
+    assert obj == expected
+    assert obj.materialize() == expected
+    assert list(obj) == list(expected)
+    assert len(obj) == len(expected)
+    assert obj["key"] == "escaped key"
+
+
+def test_lazy_array_indexing() -> None:
+    arr: Any = decode_lazy("[10, 20, [30], 40]")
+    assert len(arr) == 4
+    assert arr[0] == 10
+    assert arr[-1] == 40
+    assert arr[1:3] == [20, [30]]
+    assert list(arr) == [10, 20, [30], 40]
+
+    with pytest.raises(IndexError):
+        arr[4]
+
+
+def test_lazy_duplicate_keys_last_wins() -> None:
+    obj: Any = decode_lazy('{"a": 1, "b": 2, "a": 3}')
+    assert obj["a"] == 3
+    assert list(obj) == ["a", "b"]
+
+
+def test_lazy_object_walks_members_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    walks: list[int] = []
+    members = LazyObject._members
+
+    def counting_members(self: LazyObject) -> Any:
+        walks.append(1)
+        return members(self)
+
+    monkeypatch.setattr(LazyObject, "_members", counting_members)
+
+    s: str = "{" + ", ".join(f'"k{n}": {n}' for n in range(100)) + ', "\\u006bey": 1}'
+    obj: Any = decode_lazy(s)
+    for n in range(100):
+        assert obj[f"k{n}"] == n
+    assert obj["key"] == 1
+    assert "missing" not in obj
+    assert obj.get("other") is None
+    assert len(walks) == 1
+
+
+def test_lazy_object_contains_does_not_parse_values() -> None:
+    obj: Any = decode_lazy('{"bad": tru, "ok": 1}')
+    assert "bad" in obj
+    assert "bad" in obj.keys()
+    assert "missing" not in obj
+    assert 5 not in obj
+    assert obj._cache == {}
+
+
+def test_lazy_scalar_top_level_is_decoded_directly() -> None:
+    assert decode_lazy(' "text" ') == "text"
+    assert decode_lazy("42") == 42
+    assert decode_lazy("null") is None
+
+
+def test_lazy_empty_input_raises() -> None:
+    with pytest.raises(JSONDecodeError):
+        decode_lazy("")
+
+
+# Nothing is scanned up front, so these only fail once the container is used
+_LAZY_STRUCTURE_ERROR_CASES: tuple[str, ...] = (
+    "{",
+    '{"a": [1, 2}',
+    "[1, 2]]",
+    "{} []",
+    '["unterminated]',
+    '{"a": 1',
+    "[1, 2",
+)
+
+
+@pytest.mark.parametrize("case", _LAZY_STRUCTURE_ERROR_CASES)
+def test_lazy_structure_errors_raise_on_access(case: str) -> None:
+    doc: Any = decode_lazy(case)
+
+    with pytest.raises(JSONDecodeError):
+        len(doc)
+
+    with pytest.raises(JSONDecodeError):
+        doc.materialize()
+
+
+def test_lazy_skipped_containers_only_have_brackets_matched() -> None:
+    # The broken element is stepped over, but its brackets are fine
+    arr: Any = decode_lazy('[{"x": }, 2]')
+    assert arr[1] == 2
+
+    with pytest.raises(JSONDecodeError):
+        arr[0]["x"]
+
+    # Unbalanced brackets inside an element show up once it is stepped over
+    arr2: Any = decode_lazy("[[1, 2}, 3]")
+    with pytest.raises(JSONDecodeError):
+        arr2[1]
+
+
+def test_lazy_value_errors_raise_on_access() -> None:
+    obj: Any = decode_lazy('{"good": 1, "bad": tru, "list": [1,,2]}')
+    assert obj["good"] == 1
+
+    with pytest.raises(JSONDecodeError):
+        obj["bad"]
+
+    with pytest.raises(JSONDecodeError):
+        len(obj["list"])
+
+    with pytest.raises(JSONDecodeError):
+        decode_lazy("[1, 2,]")[0]
+
+    with pytest.raises(JSONDecodeError):
+        decode_lazy("[1 2]")[0]